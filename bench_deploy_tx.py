@@ -0,0 +1,30 @@
+# Micro-benchmark: deploy transaction build time, cached artifacts vs. web3 contract factory
+import json
+import timeit
+from web3 import Web3
+from contracts import ERC20_ABI, ERC20_BYTECODE, build_deploy_data
+
+# Offline Web3 instance - building constructor data needs no provider
+w3 = Web3()
+
+ARGS = [
+    "Benchmark Token",
+    "BENCH",
+    1000000,
+    Web3.to_checksum_address("0x000000000000000000000000000000000000dead")
+]
+
+def build_with_factory() -> str:
+    contract = w3.eth.contract(abi=json.loads(ERC20_ABI), bytecode=ERC20_BYTECODE)
+    return contract.constructor(*ARGS).data_in_transaction
+
+def build_with_artifacts() -> str:
+    return build_deploy_data("ERC20", ARGS)
+
+if __name__ == "__main__":
+    assert build_with_artifacts() == build_with_factory(), "calldata mismatch"
+    
+    number = 1000
+    for label, func in [("web3 contract factory", build_with_factory), ("cached artifacts", build_with_artifacts)]:
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{label}: {best / number * 1e6:.1f} µs per deploy transaction")
@@ -0,0 +1,215 @@
+# Contract ABIs, deployment bytecode and the precomputed artifact registry
+import json
+from eth_abi import encode
+
+# ERC20 ABI
+ERC20_ABI = '''[
+    {
+        "inputs": [
+            {
+                "internalType": "string",
+                "name": "name",
+                "type": "string"
+            },
+            {
+                "internalType": "string",
+                "name": "symbol",
+                "type": "string"
+            },
+            {
+                "internalType": "uint256",
+                "name": "initialSupply",
+                "type": "uint256"
+            },
+            {
+                "internalType": "address",
+                "name": "owner",
+                "type": "address"
+            }
+        ],
+        "stateMutability": "nonpayable",
+        "type": "constructor"
+    },
+    {
+        "inputs": [
+            {
+                "internalType": "address",
+                "name": "account",
+                "type": "address"
+            }
+        ],
+        "name": "balanceOf",
+        "outputs": [
+            {
+                "internalType": "uint256",
+                "name": "",
+                "type": "uint256"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [
+            {
+                "internalType": "uint8",
+                "name": "",
+                "type": "uint8"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "name",
+        "outputs": [
+            {
+                "internalType": "string",
+                "name": "",
+                "type": "string"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "symbol",
+        "outputs": [
+            {
+                "internalType": "string",
+                "name": "",
+                "type": "string"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "totalSupply",
+        "outputs": [
+            {
+                "internalType": "uint256",
+                "name": "",
+                "type": "uint256"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]'''
+
+# ERC721 ABI (Basic NFT)
+ERC721_ABI = '''[
+    {
+        "inputs": [
+            {
+                "internalType": "string",
+                "name": "name",
+                "type": "string"
+            },
+            {
+                "internalType": "string",
+                "name": "symbol",
+                "type": "string"
+            },
+            {
+                "internalType": "string",
+                "name": "baseURI",
+                "type": "string"
+            }
+        ],
+        "stateMutability": "nonpayable",
+        "type": "constructor"
+    },
+    {
+        "inputs": [],
+        "name": "name",
+        "outputs": [
+            {
+                "internalType": "string",
+                "name": "",
+                "type": "string"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "symbol",
+        "outputs": [
+            {
+                "internalType": "string",
+                "name": "",
+                "type": "string"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]'''
+
+# ERC1155 ABI (Multi Token)
+ERC1155_ABI = '''[
+    {
+        "inputs": [
+            {
+                "internalType": "string",
+                "name": "uri_",
+                "type": "string"
+            }
+        ],
+        "stateMutability": "nonpayable",
+        "type": "constructor"
+    },
+    {
+        "inputs": [],
+        "name": "uri",
+        "outputs": [
+            {
+                "internalType": "string",
+                "name": "",
+                "type": "string"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]'''
+
+# Smart Contract Bytecode (placeholders - you would need the actual deployment bytecode)
+ERC20_BYTECODE = "0x608060405234801562000010575f80fd5b506040516200180938038062001809833981810160405281019062000036919062000546565b8383816003908162000049919062000821565b5080600490816200005b919062000821565b5050506200007081836200007a60201b60201c565b50505050620009ff565b5f73ffffffffffffffffffffffffffffffffffffffff168273ffffffffffffffffffffffffffffffffffffffff1603620000ed575f6040517fec442f05000000000000000000000000000000000000000000000000000000008152600401620000e4919062000916565b60405180910390fd5b620001005f83836200010460201b60201c565b5050565b5f73ffffffffffffffffffffffffffffffffffffffff168373ffffffffffffffffffffffffffffffffffffffff160362000158578060025f8282546200014b91906200095e565b9250508190555062000229565b5f805f8573ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020015f2054905081811015620001e4578381836040517fe450d38c000000000000000000000000000000000000000000000000000000008152600401620001db93929190620009a9565b60405180910390fd5b8181035f808673ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020015f2081905550505b5f73ffffffffffffffffffffffffffffffffffffffff168273ffffffffffffffffffffffffffffffffffffffff160362000272578060025f8282540392505081905550620002bc565b805f808473ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020015f205f82825401925050819055505b8173ffffffffffffffffffffffffffffffffffffffff168373ffffffffffffffffffffffffffffffffffffffff167fddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef836040516200031b9190620009e4565b60405180910390a3505050565b5f604051905090565b5f80fd5b5f80fd5b5f80fd5b5f80fd5b5f601f19601f8301169050919050565b7f4e487b71000000000000000000000000000000000000000000000000000000005f52604160045260245ffd5b620003898262000341565b810181811067ffffffffffffffff82111715620003ab57620003aa62000351565b5b80604052505050565b5f620003bf62000328565b9050620003cd82826200037e565b919050565b5f67ffffffffffffffff821115620003ef57620003ee62000351565b5b620003fa8262000341565b9050602081019050919050565b5f5b838110156200042657808201518184015260208101905062000409565b5f8484015250505050565b5f620004476200044184620003d2565b620003b4565b9050828152602081018484840111156200046657620004656200033d565b5b6200047384828562000407565b509392505050565b5f82601f83011262000492576200049162000339565b5b8151620004a484826020860162000431565b91505092915050565b5f819050919050565b620004c181620004ad565b8114620004cc575f80fd5b50565b5f81519050620004df81620004b6565b92915050565b5f73ffffffffffffffffffffffffffffffffffffffff82169050919050565b5f6200051082620004e5565b9050919050565b620005228162000504565b81146200052d575f80fd5b50565b5f81519050620005408162000517565b92915050565b5f805f806080858703121562000561576200056062000331565b5b5f85015167ffffffffffffffff81111562000581576200058062000335565b5b6200058f878288016200047b565b945050602085015167ffffffffffffffff811115620005b357620005b262000335565b5b620005c1878288016200047b565b9350506040620005d487828801620004cf565b9250506060620005e78782880162000530565b91505092959194509250565b5f81519050919050565b7f4e487b71000000000000000000000000000000000000000000000000000000005f52602260045260245ffd5b5f60028204905060018216806200064257607f821691505b602082108103620006585762000657620005fd565b5b50919050565b5f819050815f5260205f209050919050565b5f6020601f8301049050919050565b5f82821b905092915050565b5f60088302620006bc7fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff826200067f565b620006c886836200067f565b95508019841693508086168417925050509392505050565b5f819050919050565b5f6200070962000703620006fd84620004ad565b620006e0565b620004ad565b9050919050565b5f819050919050565b6200072483620006e9565b6200073c620007338262000710565b8484546200068b565b825550505050565b5f90565b6200075262000744565b6200075f81848462000719565b505050565b5b8181101562000786576200077a5f8262000748565b60018101905062000765565b5050565b601f821115620007d5576200079f816200065e565b620007aa8462000670565b81016020851015620007ba578190505b620007d2620007c98562000670565b83018262000764565b50505b505050565b5f82821c905092915050565b5f620007f75f1984600802620007da565b1980831691505092915050565b5f620008118383620007e6565b9150826002028217905092915050565b6200082c82620005f3565b67ffffffffffffffff81111562000848576200084762000351565b5b6200085482546200062a565b620008618282856200078a565b5f60209050601f83116001811462000897575f841562000882578287015190505b6200088e858262000804565b865550620008fd565b601f198416620008a7866200065e565b5f5b82811015620008d057848901518255600182019150602085019450602081019050620008a9565b86831015620008f05784890151620008ec601f891682620007e6565b8355505b6001600288020188555050505b505050505050565b620009108162000504565b82525050565b5f6020820190506200092b5f83018462000905565b92915050565b7f4e487b71000000000000000000000000000000000000000000000000000000005f52601160045260245ffd5b5f6200096a82620004ad565b91506200097783620004ad565b925082820190508082111562000992576200099162000931565b5b92915050565b620009a381620004ad565b82525050565b5f606082019050620009be5f83018662000905565b620009cd602083018562000998565b620009dc604083018462000998565b949350505050565b5f602082019050620009f95f83018462000998565b92915050565b610dfc8062000a0d5f395ff3fe608060405234801561000f575f80fd5b5060043610610091575f3560e01c8063313ce56711610064578063313ce5671461013157806370a082311461014f57806395d89b411461017f578063a9059cbb1461019d578063dd62ed3e146101cd57610091565b806306fdde0314610095578063095ea7b3146100b357806318160ddd146100e357806323b872dd14610101575b5f80fd5b61009d6101fd565b6040516100aa9190610a75565b60405180910390f35b6100cd60048036038101906100c89190610b26565b61028d565b6040516100da9190610b7e565b60405180910390f35b6100eb6102af565b6040516100f89190610ba6565b60405180910390f35b61011b60048036038101906101169190610bbf565b6102b8565b6040516101289190610b7e565b60405180910390f35b6101396102e6565b6040516101469190610c2a565b60405180910390f35b61016960048036038101906101649190610c43565b6102ee565b6040516101769190610ba6565b60405180910390f35b610187610333565b6040516101949190610a75565b60405180910390f35b6101b760048036038101906101b29190610b26565b6103c3565b6040516101c49190610b7e565b60405180910390f35b6101e760048036038101906101e29190610c6e565b6103e5565b6040516101f49190610ba6565b60405180910390f35b60606003805461020c90610cd9565b80601f016020809104026020016040519081016040528092919081815260200182805461023890610cd9565b80156102835780601f1061025a57610100808354040283529160200191610283565b820191905f5260205f20905b81548152906001019060200180831161026657829003601f168201915b5050505050905090565b5f80610297610467565b90506102a481858561046e565b600191505092915050565b5f600254905090565b5f806102c2610467565b90506102cf858285610480565b6102da858585610513565b60019150509392505050565b5f6012905090565b5f805f8373ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020015f20549050919050565b60606004805461034290610cd9565b80601f016020809104026020016040519081016040528092919081815260200182805461036e90610cd9565b80156103b95780601f10610390576101008083540402835291602001916103b9565b820191905f5260205f20905b81548152906001019060200180831161039c57829003601f168201915b5050505050905090565b5f806103cd610467565b90506103da818585610513565b600191505092915050565b5f60015f8473ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020015f205f8373ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020015f2054905092915050565b5f33905090565b61047b8383836001610603565b505050565b5f61048b84846103e5565b90507fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff81101561050d57818110156104fe578281836040517ffb8f41b20000000000000000000000000000000000000000000000000000000081526004016104f593929190610d18565b60405180910390fd5b61050c84848484035f610603565b5b50505050565b5f73ffffffffffffffffffffffffffffffffffffffff168373ffffffffffffffffffffffffffffffffffffffff1603610583575f6040517f96c6fd1e00000000000000000000000000000000000000000000000000000000815260040161057a9190610d4d565b60405180910390fd5b5f73ffffffffffffffffffffffffffffffffffffffff168273ffffffffffffffffffffffffffffffffffffffff16036105f3575f6040517fec442f050000000000000000000000000000000000000000000000000000000081526004016105ea9190610d4d565b60405180910390fd5b6105fe8383836107d2565b505050565b5f73ffffffffffffffffffffffffffffffffffffffff168473ffffffffffffffffffffffffffffffffffffffff1603610673575f6040517fe602df0500000000000000000000000000000000000000000000000000000000815260040161066a9190610d4d565b60405180910390fd5b5f73ffffffffffffffffffffffffffffffffffffffff168373ffffffffffffffffffffffffffffffffffffffff16036106e3575f6040517f94280d620000000000000000000000000000000000000000000000000000000081526004016106da9190610d4d565b60405180910390fd5b8160015f8673ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020015f205f8573ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020015f208190555080156107cc578273ffffffffffffffffffffffffffffffffffffffff168473ffffffffffffffffffffffffffffffffffffffff167f8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925846040516107c39190610ba6565b60405180910390a35b50505050565b5f73ffffffffffffffffffffffffffffffffffffffff168373ffffffffffffffffffffffffffffffffffffffff1603610822578060025f8282546108169190610d93565b925050819055506108f0565b5f805f8573ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020015f20549050818110156108ab578381836040517fe450d38c0000000000000000000000000000000000000000000000000000000081526004016108a293929190610d18565b60405180910390fd5b8181035f808673ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020015f2081905550505b5f73ffffffffffffffffffffffffffffffffffffffff168273ffffffffffffffffffffffffffffffffffffffff1603610937578060025f8282540392505081905550610981565b805f808473ffffffffffffffffffffffffffffffffffffffff1673ffffffffffffffffffffffffffffffffffffffff1681526020019081526020015f205f82825401925050819055505b8173ffffffffffffffffffffffffffffffffffffffff168373ffffffffffffffffffffffffffffffffffffffff167fddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef836040516109de9190610ba6565b60405180910390a3505050565b5f81519050919050565b5f82825260208201905092915050565b5f5b83811015610a22578082015181840152602081019050610a07565b5f8484015250505050565b5f601f19601f8301169050919050565b5f610a47826109eb565b610a5181856109f5565b9350610a61818560208601610a05565b610a6a81610a2d565b840191505092915050565b5f6020820190508181035f830152610a8d8184610a3d565b905092915050565b5f80fd5b5f73ffffffffffffffffffffffffffffffffffffffff82169050919050565b5f610ac282610a99565b9050919050565b610ad281610ab8565b8114610adc575f80fd5b50565b5f81359050610aed81610ac9565b92915050565b5f819050919050565b610b0581610af3565b8114610b0f575f80fd5b50565b5f81359050610b2081610afc565b92915050565b5f8060408385031215610b3c57610b3b610a95565b5b5f610b4985828601610adf565b9250506020610b5a85828601610b12565b9150509250929050565b5f8115159050919050565b610b7881610b64565b82525050565b5f602082019050610b915f830184610b6f565b92915050565b610ba081610af3565b82525050565b5f602082019050610bb95f830184610b97565b92915050565b5f805f60608486031215610bd657610bd5610a95565b5b5f610be386828701610adf565b9350506020610bf486828701610adf565b9250506040610c0586828701610b12565b9150509250925092565b5f60ff82169050919050565b610c2481610c0f565b82525050565b5f602082019050610c3d5f830184610c1b565b92915050565b5f60208284031215610c5857610c57610a95565b5b5f610c6584828501610adf565b91505092915050565b5f8060408385031215610c8457610c83610a95565b5b5f610c9185828601610adf565b9250506020610ca285828601610adf565b9150509250929050565b7f4e487b71000000000000000000000000000000000000000000000000000000005f52602260045260245ffd5b5f6002820490506001821680610cf057607f821691505b602082108103610d0357610d02610cac565b5b50919050565b610d1281610ab8565b82525050565b5f606082019050610d2b5f830186610d09565b610d386020830185610b97565b610d456040830184610b97565b949350505050565b5f602082019050610d605f830184610d09565b92915050565b7f4e487b71000000000000000000000000000000000000000000000000000000005f52601160045260245ffd5b5f610d9d82610af3565b9150610da883610af3565b9250828201905080821115610dc057610dbf610d66565b5b9291505056fea2646970667358221220b4e22d489c5c118927538af7055c19e26d44361c7a7dd46844f7a556469d3d6b64736f6c63430008140033"  # Replace with actual bytecode
+ERC721_BYTECODE = "0x608060405234801561001057600080fd5b506040516108..."  # Replace with actual bytecode
+ERC1155_BYTECODE = "0x608060405234801561001057600080fd5b506040516109..."  # Replace with actual bytecode
+
+def load_contract_artifact(abi_json: str, bytecode_hex: str) -> dict:
+    """Parse an ABI and decode its deployment bytecode once, at startup"""
+    abi = json.loads(abi_json)
+    constructor = next((item for item in abi if item["type"] == "constructor"), {"inputs": []})
+    try:
+        bytecode = bytes.fromhex(bytecode_hex[2:] if bytecode_hex.startswith("0x") else bytecode_hex)
+    except ValueError:
+        # Placeholder bytecode - the contract can be read but not deployed
+        bytecode = None
+    return {
+        "abi": abi,
+        "bytecode": bytecode,
+        "constructor_types": [arg["type"] for arg in constructor["inputs"]]
+    }
+
+# Compiled contract artifacts, keyed by token type
+CONTRACT_ARTIFACTS = {
+    "ERC20": load_contract_artifact(ERC20_ABI, ERC20_BYTECODE),
+    "ERC721": load_contract_artifact(ERC721_ABI, ERC721_BYTECODE),
+    "ERC1155": load_contract_artifact(ERC1155_ABI, ERC1155_BYTECODE)
+}
+
+def build_deploy_data(token_type: str, constructor_args: list) -> str:
+    """Build deployment calldata: the decoded bytecode followed by the ABI-encoded constructor args"""
+    artifact = CONTRACT_ARTIFACTS[token_type]
+    return "0x" + (artifact["bytecode"] + encode(artifact["constructor_types"], constructor_args)).hex()